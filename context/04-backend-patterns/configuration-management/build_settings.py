@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Settings Compiler
+Generates a frozen-dataclass version of config_example.Settings for production
+
+Pydantic builds its validator graph at import time, which costs hundreds of
+milliseconds. This script runs once at build time and emits
+settings_compiled.py: a plain @dataclass(frozen=True, slots=True) with the
+environment reads and type coercions inlined, so production startup is just a
+bytecode load.
+
+Usage:
+    python build_settings.py [output.py]
+
+The generated file is a build artifact - regenerate it after changing
+Settings instead of editing or committing it.
+"""
+
+import sys
+import json
+import typing
+from pathlib import Path
+
+_MODULE_TEMPLATE = '''"""
+Auto-generated by build_settings.py - do not edit by hand
+Frozen dataclass equivalent of config_example.Settings with inlined env reads
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+def _as_bool(value: str) -> bool:
+    return value.lower() in ('1', 'true', 'yes', 'on')
+
+
+def _as_list(value: str) -> List[str]:
+    return json.loads(value)
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+{field_lines}
+
+    @property
+    def is_production(self) -> bool:
+        return self.app_env == "production"
+
+    @property
+    def is_development(self) -> bool:
+        return self.app_env == "development"
+
+    def get_model_for_use_case(self, use_case: str) -> dict:
+        configs = {{
+            "chat": {{"model": self.chat_model, "temperature": self.chat_temperature, "max_tokens": self.chat_max_tokens}},
+            "document": {{"model": self.doc_model, "temperature": self.doc_temperature, "max_tokens": self.doc_max_tokens}},
+            "analysis": {{"model": self.analysis_model, "temperature": self.analysis_temperature, "max_tokens": self.analysis_max_tokens}},
+        }}
+        return configs.get(use_case, {{
+            "model": self.gemini_model,
+            "temperature": self.gemini_temperature,
+            "max_tokens": self.gemini_max_tokens,
+        }})
+
+
+def load_settings() -> Settings:
+    """Read environment variables and build the frozen settings instance"""
+    env = os.environ
+    return Settings(
+{constructor_lines}
+    )
+'''
+
+
+def _annotation_name(annotation) -> str:
+    """Map a Settings annotation to the generated dataclass annotation"""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union and type(None) in typing.get_args(annotation):
+        return "Optional[str]"
+    if origin is list:
+        return "List[str]"
+    if origin is typing.Literal:
+        return "str"
+    return annotation.__name__
+
+
+def _read_expr(name: str, field) -> str:
+    """Generate the inlined env read + coercion for one field"""
+    key = name.upper()
+    annotation = field.annotation
+    origin = typing.get_origin(annotation)
+
+    if origin is typing.Union and type(None) in typing.get_args(annotation):
+        return f'env.get("{key}")'
+    if origin is list:
+        default = json.dumps(json.dumps(field.default))
+        return f'_as_list(env.get("{key}", {default}))'
+    if annotation is bool:
+        default = 'true' if field.default else 'false'
+        return f'_as_bool(env.get("{key}", "{default}"))'
+    if annotation in (int, float):
+        cast = annotation.__name__
+        if field.is_required():
+            return f'{cast}(env["{key}"])'
+        return f'{cast}(env.get("{key}", "{field.default}"))'
+    # str fields (Literal included - the values were validated at build time)
+    if field.is_required():
+        return f'env["{key}"]'
+    return f'env.get("{key}", {field.default!r})'
+
+
+def generate_module(fields) -> str:
+    """Emit the settings_compiled.py source for the given model fields"""
+    field_lines = '\n'.join(
+        f"    {name}: {_annotation_name(field.annotation)}"
+        for name, field in fields.items()
+    )
+    constructor_lines = '\n'.join(
+        f"        {name}={_read_expr(name, field)},"
+        for name, field in fields.items()
+    )
+    return _MODULE_TEMPLATE.format(
+        field_lines=field_lines,
+        constructor_lines=constructor_lines,
+    )
+
+
+def main():
+    """Compile Settings into a frozen dataclass module"""
+    output = Path(sys.argv[1]) if len(sys.argv) > 1 else Path('settings_compiled.py')
+
+    from config_example import Settings
+
+    output.write_text(generate_module(Settings.model_fields), encoding='utf-8')
+    print(f"✅ Wrote {output} ({len(Settings.model_fields)} fields)")
+    print("   Use `from settings_compiled import load_settings` in production")
+
+
+if __name__ == "__main__":
+    main()
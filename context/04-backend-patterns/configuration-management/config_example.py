@@ -1,145 +1,227 @@
 """
 Example configuration module for FastAPI applications
 Shows how to use the environment variables with Pydantic Settings
+
+Pydantic is imported lazily: modules that import this one but never
+touch `Settings` don't pay the import cost (PEP 562 module __getattr__).
 """
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional, List, Literal
-from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from typing import List, Literal
 
-class Settings(BaseSettings):
-    """
-    Application settings loaded from environment variables
-    Uses Pydantic for validation and type safety
-    """
-    
-    # ==============================================
-    # Application Settings
-    # ==============================================
-    app_name: str = "AI Application"
-    app_env: Literal["development", "staging", "production"] = "development"
-    app_host: str = "0.0.0.0"
-    app_port: int = 8000
-    app_debug: bool = False
-    
-    # ==============================================
-    # Google Gemini Configuration
-    # ==============================================
-    gemini_api_key: str
-    gemini_model: str = "gemini-2.5-flash"
-    gemini_temperature: float = 0.7
-    gemini_max_tokens: int = 1000
-    gemini_top_p: float = 0.95
-    gemini_thinking_mode: bool = False
-    
-    # ==============================================
-    # Use Case: Chat
-    # ==============================================
-    chat_model: str = "gemini-2.5-flash"
-    chat_temperature: float = 0.7
-    chat_max_tokens: int = 1000
-    chat_streaming: bool = True
-    
-    # ==============================================
-    # Use Case: Document Generation
-    # ==============================================
-    doc_model: str = "gemini-2.5-pro"
-    doc_temperature: float = 0.5
-    doc_max_tokens: int = 4000
-    doc_thinking_mode: bool = True
-    
-    # ==============================================
-    # Use Case: Document Analysis
-    # ==============================================
-    analysis_model: str = "gemini-2.5-pro"
-    analysis_temperature: float = 0.2
-    analysis_max_tokens: int = 2000
-    analysis_enable_pdf: bool = True
-    analysis_enable_vision: bool = True
-    
-    # ==============================================
-    # Database
-    # ==============================================
-    database_url: str = "sqlite:///./app.db"
-    database_echo: bool = False
-    
-    # ==============================================
-    # Security
-    # ==============================================
-    secret_key: str
-    jwt_expiration: int = 3600
-    cors_origins: List[str] = ["http://localhost:3000"]
-    
-    # ==============================================
-    # Rate Limiting
-    # ==============================================
-    rate_limit_requests: int = 100
-    rate_limit_window: int = 3600
-    
-    # ==============================================
-    # File Paths
-    # ==============================================
-    upload_dir: str = "./uploads"
-    log_dir: str = "./logs"
-    temp_dir: str = "/tmp"
-    
-    # ==============================================
-    # Optional: Fallback Models
-    # ==============================================
-    claude_api_key: Optional[str] = None
-    openai_api_key: Optional[str] = None
-    enable_fallback: bool = False
-    
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False
-    )
-    
-    @property
-    def is_production(self) -> bool:
-        """Check if running in production"""
-        return self.app_env == "production"
-    
-    @property
-    def is_development(self) -> bool:
-        """Check if running in development"""
-        return self.app_env == "development"
-    
-    def get_model_for_use_case(self, use_case: str) -> dict:
-        """Get model configuration for a specific use case"""
-        configs = {
-            "chat": {
-                "model": self.chat_model,
-                "temperature": self.chat_temperature,
-                "max_tokens": self.chat_max_tokens,
-            },
-            "document": {
-                "model": self.doc_model,
-                "temperature": self.doc_temperature,
-                "max_tokens": self.doc_max_tokens,
-            },
-            "analysis": {
-                "model": self.analysis_model,
-                "temperature": self.analysis_temperature,
-                "max_tokens": self.analysis_max_tokens,
-            },
-        }
-        return configs.get(use_case, {
-            "model": self.gemini_model,
-            "temperature": self.gemini_temperature,
-            "max_tokens": self.gemini_max_tokens,
-        })
-
-
-@lru_cache()
-def get_settings() -> Settings:
+
+def _load_settings_class():
+    """Import Pydantic and define the Settings class on first use"""
+    cls = globals().get("Settings")
+    if cls is not None:
+        return cls
+
+    from pydantic import PrivateAttr
+    from pydantic_settings import BaseSettings, SettingsConfigDict
+    from typing import Dict, List, Literal
+
+    class Settings(BaseSettings):
+        """
+        Application settings loaded from environment variables
+        Uses Pydantic for validation and type safety
+        """
+
+        # Caches filled in by model_post_init; plain dicts so instances
+        # stay picklable and deep-copyable
+        _use_case_configs: Dict[str, Dict[str, Any]] = PrivateAttr(default_factory=dict)
+        _default_config: Dict[str, Any] = PrivateAttr(default_factory=dict)
+        _is_prod: bool = PrivateAttr(default=False)
+        _is_dev: bool = PrivateAttr(default=False)
+
+        # ==============================================
+        # Application Settings
+        # ==============================================
+        app_name: str = "AI Application"
+        app_env: Literal["development", "staging", "production"] = "development"
+        app_host: str = "0.0.0.0"
+        app_port: int = 8000
+        app_debug: bool = False
+
+        # ==============================================
+        # Google Gemini Configuration
+        # ==============================================
+        gemini_api_key: str
+        gemini_model: str = "gemini-2.5-flash"
+        gemini_temperature: float = 0.7
+        gemini_max_tokens: int = 1000
+        gemini_top_p: float = 0.95
+        gemini_thinking_mode: bool = False
+
+        # ==============================================
+        # Use Case: Chat
+        # ==============================================
+        chat_model: str = "gemini-2.5-flash"
+        chat_temperature: float = 0.7
+        chat_max_tokens: int = 1000
+        chat_streaming: bool = True
+
+        # ==============================================
+        # Use Case: Document Generation
+        # ==============================================
+        doc_model: str = "gemini-2.5-pro"
+        doc_temperature: float = 0.5
+        doc_max_tokens: int = 4000
+        doc_thinking_mode: bool = True
+
+        # ==============================================
+        # Use Case: Document Analysis
+        # ==============================================
+        analysis_model: str = "gemini-2.5-pro"
+        analysis_temperature: float = 0.2
+        analysis_max_tokens: int = 2000
+        analysis_enable_pdf: bool = True
+        analysis_enable_vision: bool = True
+
+        # ==============================================
+        # Database
+        # ==============================================
+        database_url: str = "sqlite:///./app.db"
+        database_echo: bool = False
+
+        # ==============================================
+        # Security
+        # ==============================================
+        secret_key: str
+        jwt_expiration: int = 3600
+        cors_origins: List[str] = ["http://localhost:3000"]
+
+        # ==============================================
+        # Rate Limiting
+        # ==============================================
+        rate_limit_requests: int = 100
+        rate_limit_window: int = 3600
+
+        # ==============================================
+        # File Paths
+        # ==============================================
+        upload_dir: str = "./uploads"
+        log_dir: str = "./logs"
+        temp_dir: str = "/tmp"
+
+        # ==============================================
+        # Optional: Fallback Models
+        # ==============================================
+        claude_api_key: Optional[str] = None
+        openai_api_key: Optional[str] = None
+        enable_fallback: bool = False
+
+        # frozen=True: the singleton is read-only after validation, which
+        # also lets Pydantic skip per-assignment validation machinery
+        model_config = SettingsConfigDict(
+            env_file=".env",
+            env_file_encoding="utf-8",
+            case_sensitive=False,
+            frozen=True
+        )
+
+        @property
+        def is_production(self) -> bool:
+            """Check if running in production"""
+            return self._is_prod
+
+        @property
+        def is_development(self) -> bool:
+            """Check if running in development"""
+            return self._is_dev
+
+        def model_post_init(self, __context) -> None:
+            """Precompute per-use-case model configs once after validation"""
+            # app_env is fixed after validation, so the environment checks
+            # can be plain attribute reads instead of string comparisons
+            self._is_prod = self.app_env == "production"
+            self._is_dev = self.app_env == "development"
+            self._use_case_configs = {
+                "chat": {
+                    "model": self.chat_model,
+                    "temperature": self.chat_temperature,
+                    "max_tokens": self.chat_max_tokens,
+                },
+                "document": {
+                    "model": self.doc_model,
+                    "temperature": self.doc_temperature,
+                    "max_tokens": self.doc_max_tokens,
+                },
+                "analysis": {
+                    "model": self.analysis_model,
+                    "temperature": self.analysis_temperature,
+                    "max_tokens": self.analysis_max_tokens,
+                },
+            }
+            self._default_config = {
+                "model": self.gemini_model,
+                "temperature": self.gemini_temperature,
+                "max_tokens": self.gemini_max_tokens,
+            }
+
+        def get_model_for_use_case(self, use_case: str) -> Mapping[str, Any]:
+            """
+            Get model configuration for a specific use case
+            The returned mapping is read-only; copy it with dict(...) to modify
+            """
+            # Wrap at return time: the proxy is a cheap view, and keeping
+            # plain dicts in the instance preserves pickle/deepcopy support
+            return MappingProxyType(
+                self._use_case_configs.get(use_case, self._default_config)
+            )
+
+        def as_bytes(self) -> bytes:
+            """
+            JSON-encode the settings for startup logging
+            Uses msgspec's C encoder when installed, stdlib json otherwise
+            """
+            data = self.model_dump()
+            try:
+                import msgspec.json
+                return msgspec.json.encode(data)
+            except ImportError:
+                import json
+                return json.dumps(data, default=str).encode("utf-8")
+
+    # The class is published as a module attribute, so fix the qualname
+    # (otherwise '_load_settings_class.<locals>.Settings' breaks pickling)
+    Settings.__qualname__ = "Settings"
+    globals()["Settings"] = Settings
+    return Settings
+
+
+def __getattr__(name: str):
+    """PEP 562 hook: `from config_example import Settings` imports lazily"""
+    if name == "Settings":
+        return _load_settings_class()
+    if name == "settings":
+        # Materialize the singleton as a real module attribute, so every
+        # access after the first is a plain load with no wrapper call
+        instance = get_settings()
+        globals()["settings"] = instance
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Module-level singleton: survives monkeypatching pitfalls of lru_cache
+# and makes the hot path a plain global load instead of a cache lookup
+_settings: Optional["Settings"] = None
+
+
+def get_settings() -> "Settings":
     """
-    Get cached settings instance
-    Uses lru_cache to avoid reading .env file multiple times
+    Get the shared settings instance
+    Created once per process so the .env file is only parsed once
+
+    Kept for FastAPI's Depends(get_settings); non-DI code can simply do
+    `from config_example import settings` for direct attribute access
     """
-    return Settings()
+    global _settings
+    if _settings is None:
+        _settings = _load_settings_class()()
+    return _settings
 
 
 # ==============================================
@@ -148,31 +230,31 @@ def get_settings() -> Settings:
 if __name__ == "__main__":
     # Example: Load and display settings
     settings = get_settings()
-    
+
     print(f"App Name: {settings.app_name}")
     print(f"Environment: {settings.app_env}")
     print(f"Debug Mode: {settings.app_debug}")
     print(f"Default Model: {settings.gemini_model}")
-    
+
     # Get configuration for specific use case
     chat_config = settings.get_model_for_use_case("chat")
     print(f"\nChat Configuration:")
     print(f"  Model: {chat_config['model']}")
     print(f"  Temperature: {chat_config['temperature']}")
     print(f"  Max Tokens: {chat_config['max_tokens']}")
-    
+
     # Example FastAPI usage:
     """
     from fastapi import FastAPI, Depends
     import google.generativeai as genai
-    
+
     app = FastAPI()
-    
+
     @app.on_event("startup")
     async def startup_event():
         settings = get_settings()
         genai.configure(api_key=settings.gemini_api_key)
-    
+
     @app.post("/chat")
     async def chat(
         message: str,
@@ -188,4 +270,4 @@ if __name__ == "__main__":
         )
         response = model.generate_content(message)
         return {"response": response.text}
-    """
\ No newline at end of file
+    """
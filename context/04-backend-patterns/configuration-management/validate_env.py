@@ -4,8 +4,13 @@ Environment Configuration Validator
 Validates your .env file configuration for AI applications
 """
 
+import hashlib
+import json
+import mmap
 import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -21,83 +26,270 @@ def check_file_exists(filename: str) -> bool:
     """Check if a file exists in the current directory"""
     return Path(filename).exists()
 
+# Matches KEY=value lines; comments and blank lines never match,
+# so a single findall() replaces the per-line strip/split loop.
+# Bytes pattern: it runs directly over the memory-mapped file
+_LINE_RE = re.compile(rb'^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$', re.M)
+
+# python-dotenv strips surrounding quotes and unquoted inline comments
+# ('true  # note'), so the validator must see the same value Settings()
+# actually loads
+_INLINE_COMMENT_RE = re.compile(r'\s+#.*$')
+
+def _decode_value(raw: bytes) -> str:
+    """Decode a matched value the way python-dotenv would load it"""
+    value = raw.decode('utf-8')
+    quote = value[:1]
+    if quote in ('"', "'"):
+        # Quoted: take everything up to the closing quote ('#' inside
+        # the quotes is data, anything after them is a comment)
+        end = value.find(quote, 1)
+        if end != -1:
+            return value[1:end]
+        return value
+    return _INLINE_COMMENT_RE.sub('', value)
+
 def load_env_file(filename: str) -> Dict[str, str]:
     """Load environment variables from a file"""
-    env_vars = {}
     if not check_file_exists(filename):
-        return env_vars
-    
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                env_vars[key.strip()] = value.strip()
-    
-    return env_vars
+        return {}
+
+    # Memory-map the file and scan it in place; only the matched
+    # key/value slices are ever decoded into Python strings
+    with open(filename, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                pairs = _LINE_RE.findall(buf)
+        except ValueError:
+            return {}  # empty files can't be mapped
+
+    return {key.decode('ascii'): _decode_value(value) for key, value in pairs}
+
+# Human-readable descriptions for the variables we know about
+_VAR_DESCRIPTIONS = {
+    'GEMINI_API_KEY': 'Google Gemini API key',
+    'SECRET_KEY': 'Application secret key',
+    'DATABASE_URL': 'Database connection string',
+}
+
+def _derive_required_vars() -> Dict[str, str]:
+    """
+    Build the required-variable map from the Settings schema so this
+    validator and config_example.py can't drift apart. Falls back to the
+    known list when Pydantic isn't installed.
+    """
+    try:
+        from config_example import Settings
+        names = [name.upper() for name, field in Settings.model_fields.items()
+                 if field.is_required()]
+    except ImportError:
+        names = list(_VAR_DESCRIPTIONS)
 
-def validate_required_vars(env_vars: Dict[str, str]) -> List[Tuple[str, str]]:
-    """Validate required environment variables"""
+    return {name: _VAR_DESCRIPTIONS.get(name, 'Required by Settings') for name in names}
+
+_REQUIRED_VARS = _derive_required_vars()
+
+# Template placeholders all share the 'your-' prefix (your-secret-key-here,
+# your-gemini-api-key-here, ...), so one prefix check covers them all
+_PLACEHOLDER_PREFIXES = ('your-',)
+
+# Known-good Gemini model names (frozenset for O(1) membership checks)
+_VALID_GEMINI_MODELS = frozenset({
+    'gemini-2.5-pro',
+    'gemini-2.5-flash',
+    'gemini-2.5-flash-lite',
+    'models/text-embedding-004',
+})
+_VALID_MODELS_STR = ', '.join(sorted(_VALID_GEMINI_MODELS))
+
+def _make_numeric_check(parse, low, high, range_msg: str, invalid_msg: str):
+    """Build a numeric range check from a table entry"""
+    def check(var: str, value: str):
+        try:
+            number = parse(value)
+        except ValueError:
+            return (var, invalid_msg.format(value=value))
+        if number < low or number > high:
+            return (var, range_msg.format(value=number))
+        return None
+    return check
+
+# Key must mention both GEMINI and MODEL, in either order; the two
+# lookaheads do it in one compiled scan instead of two substring scans
+_MODEL_KEY_RE = re.compile(r'(?=.*GEMINI)(?=.*MODEL)')
+
+def _check_model(var: str, value: str):
+    """AI model names should be current"""
+    if _MODEL_KEY_RE.match(var) and value and value not in _VALID_GEMINI_MODELS:
+        return (var, f"Invalid model '{value}'. Valid models: {_VALID_MODELS_STR}")
+    return None
+
+# Dispatch table: first matching key substring picks the check.
+# Numeric entries are table-driven so both share one parse/range path.
+_RULES = {
+    'TEMPERATURE': _make_numeric_check(
+        float, 0, 2,
+        "Temperature {value} out of range (0-2)",
+        "Invalid temperature value: {value}",
+    ),
+    'MAX_TOKENS': _make_numeric_check(
+        int, 1, 1000000,
+        "Max tokens {value} seems unreasonable",
+        "Invalid token value: {value}",
+    ),
+    'MODEL': _check_model,
+}
+
+def validate_env_vars(env_vars: Dict[str, str]) -> List[Tuple[str, str]]:
+    """Run all validations in a single pass over the variables"""
     issues = []
-    
-    # Required variables
-    required = {
-        'GEMINI_API_KEY': 'Google Gemini API key',
-        'SECRET_KEY': 'Application secret key',
-        'DATABASE_URL': 'Database connection string',
-    }
-    
-    for var, description in required.items():
-        if var not in env_vars:
-            issues.append((var, f"Missing required: {description}"))
-        elif env_vars[var] in ['', 'your-secret-key-here', 'your-gemini-api-key-here']:
+
+    # Missing required variables (C-level set difference)
+    for var in sorted(_REQUIRED_VARS.keys() - env_vars.keys()):
+        issues.append((var, f"Missing required: {_REQUIRED_VARS[var]}"))
+
+    # One traversal instead of one per validator
+    for var, value in env_vars.items():
+        description = _REQUIRED_VARS.get(var)
+        if description is not None and (value == '' or value.startswith(_PLACEHOLDER_PREFIXES)):
             issues.append((var, f"Replace placeholder value for: {description}"))
-    
-    return issues
 
-def validate_model_names(env_vars: Dict[str, str]) -> List[Tuple[str, str]]:
-    """Validate AI model names are current"""
-    issues = []
-    valid_gemini_models = [
-        'gemini-2.5-pro',
-        'gemini-2.5-flash',
-        'gemini-2.5-flash-lite',
-        'models/text-embedding-004'
-    ]
-    
-    model_vars = [key for key in env_vars if 'MODEL' in key and 'GEMINI' in key]
-    
-    for var in model_vars:
-        model = env_vars[var]
-        if model and model not in valid_gemini_models:
-            issues.append((var, f"Invalid model '{model}'. Valid models: {', '.join(valid_gemini_models)}"))
-    
+        check = next((fn for substring, fn in _RULES.items() if substring in var), None)
+        if check is not None:
+            issue = check(var, value)
+            if issue is not None:
+                issues.append(issue)
+
     return issues
 
-def validate_numeric_ranges(env_vars: Dict[str, str]) -> List[Tuple[str, str]]:
-    """Validate numeric values are in acceptable ranges"""
+# msgspec's C-level JSON encoder is ~5-10x faster than stdlib json;
+# fall back to the stdlib when it isn't installed
+try:
+    import msgspec.json
+    _cache_encode = msgspec.json.encode
+    _cache_decode = msgspec.json.decode
+except ImportError:
+    def _cache_encode(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def _cache_decode(data):
+        return json.loads(data)
+
+# Cache validation results keyed on the file's mtime so unchanged
+# files can skip re-running the validators entirely
+_CACHE_DIR = Path.home() / '.cache' / 'validate_env'
+
+def _cache_path(env_file: str) -> Path:
+    """Cache file location for a given .env path"""
+    digest = hashlib.sha256(str(Path(env_file).resolve()).encode('utf-8')).hexdigest()[:16]
+    return _CACHE_DIR / f"{digest}.json"
+
+def _load_cached_results(env_file: str, mtime: int):
+    """Return cached (issues, warnings) if the file hasn't changed since last run"""
+    try:
+        cached = _cache_decode(_cache_path(env_file).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    if cached.get('mtime') != mtime:
+        return None
+
+    issues = [tuple(item) for item in cached.get('issues', [])]
+    warnings = [tuple(item) for item in cached.get('warnings', [])]
+    return issues, warnings
+
+def _save_cached_results(env_file: str, mtime: int, issues, warnings):
+    """Persist validation results for the fast path (best-effort)"""
+    cache_file = _cache_path(env_file)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix('.tmp')
+        tmp_file.write_bytes(
+            _cache_encode({'mtime': mtime, 'issues': issues, 'warnings': warnings})
+        )
+        os.replace(tmp_file, cache_file)  # atomic swap
+    except OSError:
+        pass
+
+# Map JSON-Schema types onto casts for the raw env string values
+def _cast_bool(value: str) -> bool:
+    lowered = value.lower()
+    if lowered in ('1', 'true', 'yes', 'on'):
+        return True
+    if lowered in ('0', 'false', 'no', 'off'):
+        return False
+    raise ValueError(value)
+
+# List fields arrive as JSON strings ('["..."]'), the same format
+# pydantic-settings itself expects for them
+_SCHEMA_CASTS = {'integer': int, 'number': float, 'boolean': _cast_bool, 'array': json.loads}
+
+# False = not compiled yet, None = optional deps missing
+_schema_validator = False
+
+def _load_schema_validator():
+    """
+    Compile a validator from the Settings JSON Schema via fastjsonschema
+    Returns (validate, properties, error_cls), or None when the optional
+    dependencies (pydantic, fastjsonschema) aren't installed
+    """
+    global _schema_validator
+    if _schema_validator is not False:
+        return _schema_validator
+
+    try:
+        import fastjsonschema
+        from config_example import Settings
+    except ImportError:
+        _schema_validator = None
+        return None
+
+    schema = Settings.model_json_schema()
+    schema.pop('required', None)  # missing vars are reported separately
+    _schema_validator = (
+        fastjsonschema.compile(schema),
+        schema.get('properties', {}),
+        fastjsonschema.JsonSchemaException,
+    )
+    return _schema_validator
+
+def validate_against_schema(env_vars: Dict[str, str]) -> List[Tuple[str, str]]:
+    """
+    Type-check variables against the compiled Settings schema
+    Covers fields the hand-rolled rules don't (ports, booleans, ...)
+    """
+    compiled = _load_schema_validator()
+    if compiled is None:
+        return []
+    validate, properties, schema_error = compiled
+
     issues = []
-    
-    # Temperature should be between 0 and 2
-    temp_vars = [key for key in env_vars if 'TEMPERATURE' in key]
-    for var in temp_vars:
+    for var, value in env_vars.items():
+        if any(substring in var for substring in _RULES):
+            continue  # already covered by the dispatch-table checks
+
+        field = var.lower()
+        prop = properties.get(field)
+        if prop is None:
+            continue
+
+        cast = _SCHEMA_CASTS.get(prop.get('type'))
         try:
-            temp = float(env_vars[var])
-            if temp < 0 or temp > 2:
-                issues.append((var, f"Temperature {temp} out of range (0-2)"))
+            typed = cast(value) if cast else value
         except ValueError:
-            issues.append((var, f"Invalid temperature value: {env_vars[var]}"))
-    
-    # Max tokens should be reasonable
-    token_vars = [key for key in env_vars if 'MAX_TOKENS' in key]
-    for var in token_vars:
+            issues.append((var, f"Expected {prop['type']} value, got: {value}"))
+            continue
+
         try:
-            tokens = int(env_vars[var])
-            if tokens < 1 or tokens > 1000000:
-                issues.append((var, f"Max tokens {tokens} seems unreasonable"))
-        except ValueError:
-            issues.append((var, f"Invalid token value: {env_vars[var]}"))
-    
+            validate({field: typed})
+        except schema_error as exc:
+            # Rewrite 'data.<field> must ...' in the script's own voice
+            reason = exc.message
+            prefix = f"data.{field} "
+            if reason.startswith(prefix):
+                reason = reason[len(prefix):]
+            issues.append((var, f"Invalid value: {reason}"))
+
     return issues
 
 def check_security(env_vars: Dict[str, str]) -> List[Tuple[str, str]]:
@@ -108,7 +300,7 @@ def check_security(env_vars: Dict[str, str]) -> List[Tuple[str, str]]:
     if env_vars.get('APP_DEBUG', '').lower() == 'true' and env_vars.get('APP_ENV') == 'production':
         warnings.append(('APP_DEBUG', "Debug mode should be disabled in production"))
     
-    if env_vars.get('SECRET_KEY', '').startswith('your-'):
+    if env_vars.get('SECRET_KEY', '').startswith(_PLACEHOLDER_PREFIXES):
         warnings.append(('SECRET_KEY', "Using placeholder secret key - generate a secure one"))
     
     # Check CORS settings
@@ -118,44 +310,78 @@ def check_security(env_vars: Dict[str, str]) -> List[Tuple[str, str]]:
     
     return warnings
 
+# Prefixes used on every issue/warning line, joined once up front
+_RED_BULLET = f"   {Colors.RED}• "
+_YELLOW_BULLET = f"   {Colors.YELLOW}• "
+
 def print_results(env_file: str, env_vars: Dict[str, str], issues: List[Tuple[str, str]], warnings: List[Tuple[str, str]]):
-    """Print validation results"""
-    print(f"\n{Colors.BLUE}Environment Configuration Validator{Colors.END}")
-    print(f"{Colors.BLUE}{'=' * 50}{Colors.END}")
-    
-    print(f"\n📄 Checking: {env_file}")
-    print(f"📊 Total variables found: {len(env_vars)}")
-    
+    """Print validation results in a single buffered write"""
+    out = [
+        f"\n{Colors.BLUE}Environment Configuration Validator{Colors.END}\n",
+        f"{Colors.BLUE}{'=' * 50}{Colors.END}\n",
+        f"\n📄 Checking: {env_file}\n",
+        f"📊 Total variables found: {len(env_vars)}\n",
+    ]
+
     if not issues and not warnings:
-        print(f"\n{Colors.GREEN}✅ All checks passed! Your configuration looks good.{Colors.END}")
+        out.append(f"\n{Colors.GREEN}✅ All checks passed! Your configuration looks good.{Colors.END}\n")
     else:
         if issues:
-            print(f"\n{Colors.RED}❌ Issues Found ({len(issues)}):{Colors.END}")
+            out.append(f"\n{Colors.RED}❌ Issues Found ({len(issues)}):{Colors.END}\n")
             for var, issue in issues:
-                print(f"   {Colors.RED}• {var}: {issue}{Colors.END}")
-        
+                out.append(f"{_RED_BULLET}{var}: {issue}{Colors.END}\n")
+
         if warnings:
-            print(f"\n{Colors.YELLOW}⚠️  Warnings ({len(warnings)}):{Colors.END}")
+            out.append(f"\n{Colors.YELLOW}⚠️  Warnings ({len(warnings)}):{Colors.END}\n")
             for var, warning in warnings:
-                print(f"   {Colors.YELLOW}• {var}: {warning}{Colors.END}")
-    
+                out.append(f"{_YELLOW_BULLET}{var}: {warning}{Colors.END}\n")
+
     # Show some configuration details
-    print(f"\n{Colors.BLUE}Current Configuration:{Colors.END}")
-    print(f"   • Environment: {env_vars.get('APP_ENV', 'Not set')}")
-    print(f"   • Default Model: {env_vars.get('GEMINI_MODEL', 'Not set')}")
-    print(f"   • Chat Model: {env_vars.get('CHAT_MODEL', 'Not set')}")
-    print(f"   • Debug Mode: {env_vars.get('APP_DEBUG', 'Not set')}")
+    out.append(f"\n{Colors.BLUE}Current Configuration:{Colors.END}\n")
+    out.append(f"   • Environment: {env_vars.get('APP_ENV', 'Not set')}\n")
+    out.append(f"   • Default Model: {env_vars.get('GEMINI_MODEL', 'Not set')}\n")
+    out.append(f"   • Chat Model: {env_vars.get('CHAT_MODEL', 'Not set')}\n")
+    out.append(f"   • Debug Mode: {env_vars.get('APP_DEBUG', 'Not set')}\n")
+
+    # One write instead of a print() syscall per line
+    sys.stdout.write(''.join(out))
+
+def _validate_one(env_file: str):
+    """Validate a single file; returns (env_file, env_vars, issues, warnings)"""
+    env_vars = load_env_file(env_file)
+
+    # Fast path: in an empty file only the required-vars check can fire,
+    # so skip the validator dispatch and cache machinery entirely
+    if not env_vars:
+        issues = [(var, f"Missing required: {desc}")
+                  for var, desc in sorted(_REQUIRED_VARS.items())]
+        return env_file, env_vars, issues, []
+
+    # Skip re-validation when the file hasn't changed since last run
+    mtime = os.stat(env_file).st_mtime_ns
+    cached = _load_cached_results(env_file, mtime)
+
+    if cached is not None:
+        issues, warnings = cached
+    else:
+        # Run validations
+        issues = validate_env_vars(env_vars)
+        issues.extend(validate_against_schema(env_vars))
+        warnings = check_security(env_vars)
+
+        _save_cached_results(env_file, mtime, issues, warnings)
+
+    return env_file, env_vars, issues, warnings
 
 def main():
     """Main validation function"""
-    # Check which .env file to validate
-    if len(sys.argv) > 1:
-        env_file = sys.argv[1]
-    else:
-        env_file = '.env'
-    
-    if not check_file_exists(env_file):
-        print(f"{Colors.RED}❌ Error: {env_file} not found!{Colors.END}")
+    # Check which .env file(s) to validate
+    env_files = sys.argv[1:] or ['.env']
+
+    missing = [env_file for env_file in env_files if not check_file_exists(env_file)]
+    if missing:
+        for env_file in missing:
+            print(f"{Colors.RED}❌ Error: {env_file} not found!{Colors.END}")
         print(f"\nAvailable templates:")
         templates = ['.env.simple', '.env.complete', '.env.example']
         for template in templates:
@@ -164,23 +390,23 @@ def main():
         print(f"\nCopy a template to get started:")
         print(f"   cp .env.simple .env")
         return
-    
-    # Load and validate
-    env_vars = load_env_file(env_file)
-    
-    # Run validations
-    issues = []
-    issues.extend(validate_required_vars(env_vars))
-    issues.extend(validate_model_names(env_vars))
-    issues.extend(validate_numeric_ranges(env_vars))
-    
-    warnings = check_security(env_vars)
-    
+
+    if len(env_files) == 1:
+        results = [_validate_one(env_files[0])]
+    else:
+        # Each file is independent and CPU-bound (regex + parsing),
+        # so validate them across worker processes
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_validate_one, env_files))
+
     # Print results
-    print_results(env_file, env_vars, issues, warnings)
-    
+    any_issues = False
+    for env_file, env_vars, issues, warnings in results:
+        print_results(env_file, env_vars, issues, warnings)
+        any_issues = any_issues or bool(issues)
+
     # Exit with error code if issues found
-    sys.exit(1 if issues else 0)
+    sys.exit(1 if any_issues else 0)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file